@@ -1,4 +1,3 @@
-import re
 from abc import ABC, abstractmethod
 from enum import IntEnum
 from functools import wraps
@@ -89,6 +88,22 @@ class BlueforsMetrics(Metrics, ABC):
     def __init__(self, api: BlueforsLD400, subsystem: str):
         super().__init__('bluefors', subsystem)
         self.api = api
+        # (setter, reader, transform) triples; see _update_jobs.
+        self._jobs: tuple = ()
+
+    def _update_jobs(self):
+        """
+        Read every job's value, apply its transform and publish it,
+        falling back to NaN when the API read fails.
+        """
+        for setter, reader, transform in self._jobs:
+            try:
+                value = reader()
+                if transform is not None:
+                    value = transform(value)
+            except APIError:
+                value = NaN
+            setter(value)
 
 
 class PulseTubeCompressorMetrics(BlueforsMetrics):
@@ -116,42 +131,19 @@ class PulseTubeCompressorMetrics(BlueforsMetrics):
         self.high_pressure = self.create_gauge(name='high_pressure',
                                                documentation='High pressure in pulse tube circuit',
                                                unit='bars')
-    @handle_exceptions(APIError)
-    def get_motor_current(self):
-        return self.api.cpa.motor_current()
-
-    @handle_exceptions(APIError)
-    def get_coolant_in_temperature(self):
-        return to_celsius(self.api.cpa.coolant_in_temperature())
-
-    @handle_exceptions(APIError)
-    def get_coolant_out_temperature(self):
-        return to_celsius(self.api.cpa.coolant_out_temperature())
-
-    @handle_exceptions(APIError)
-    def get_oil_temperature(self):
-        return self.api.cpa.oil_temperature()
-
-    @handle_exceptions(APIError)
-    def get_helium_temperature(self):
-        return self.api.cpa.helium_temperature()
-
-    @handle_exceptions(APIError)
-    def get_low_pressure(self):
-        return self.api.cpa.low_pressure()
 
-    @handle_exceptions(APIError)
-    def get_high_pressure(self):
-        return self.api.cpa.high_pressure()
+        self._jobs = (
+            (self.motor_current.set, api.cpa.motor_current, None),
+            (self.coolant_in_temperature.set, api.cpa.coolant_in_temperature, to_celsius),
+            (self.coolant_out_temperature.set, api.cpa.coolant_out_temperature, to_celsius),
+            (self.oil_temperature.set, api.cpa.oil_temperature, to_celsius),
+            (self.helium_temperature.set, api.cpa.helium_temperature, to_celsius),
+            (self.low_pressure.set, api.cpa.low_pressure, None),
+            (self.high_pressure.set, api.cpa.high_pressure, None),
+        )
 
     def update_metrics(self):
-        self.motor_current.set(self.get_motor_current())
-        self.coolant_in_temperature.set(self.get_coolant_in_temperature())
-        self.coolant_out_temperature.set(self.get_coolant_out_temperature())
-        self.oil_temperature.set(to_celsius(self.get_oil_temperature()))
-        self.helium_temperature.set(to_celsius(self.get_helium_temperature()))
-        self.low_pressure.set(self.get_low_pressure())
-        self.high_pressure.set(self.get_high_pressure())
+        self._update_jobs()
 
 
 class ScrollPumpMetrics(BlueforsMetrics):
@@ -177,37 +169,17 @@ class ScrollPumpMetrics(BlueforsMetrics):
                                                       documentation='Scroll pump rotational frequency',
                                                       unit='hertz')
 
-    @handle_exceptions(APIError)
-    def get_controller_temperature(self):
-        return to_celsius(self.api.nxds.controller_temperature())
-
-    @handle_exceptions(APIError)
-    def get_link_current(self):
-        return self.api.nxds.link_current()
-
-    @handle_exceptions(APIError)
-    def get_link_power(self):
-        return self.api.nxds.link_power()
-
-    @handle_exceptions(APIError)
-    def get_link_voltage(self):
-        return self.api.nxds.link_voltage()
-
-    @handle_exceptions(APIError)
-    def get_pump_temperature(self):
-        return to_celsius(self.api.nxds.pump_temperature())
-
-    @handle_exceptions(APIError)
-    def get_rotational_frequency(self):
-        return self.api.nxds.rotational_frequency()
+        self._jobs = (
+            (self.controller_temperature.set, api.nxds.controller_temperature, to_celsius),
+            (self.link_current.set, api.nxds.link_current, None),
+            (self.link_power.set, api.nxds.link_power, None),
+            (self.link_voltage.set, api.nxds.link_voltage, None),
+            (self.pump_temperature.set, api.nxds.pump_temperature, to_celsius),
+            (self.rotational_frequency.set, api.nxds.rotational_frequency, None),
+        )
 
     def update_metrics(self):
-        self.controller_temperature.set(self.get_controller_temperature())
-        self.link_current.set(self.get_link_current())
-        self.link_power.set(self.get_link_power())
-        self.link_voltage.set(self.get_link_voltage())
-        self.pump_temperature.set(self.get_pump_temperature())
-        self.rotational_frequency.set(self.get_rotational_frequency())
+        self._update_jobs()
 
 
 class TurboPumpMetrics(BlueforsMetrics):
@@ -222,17 +194,13 @@ class TurboPumpMetrics(BlueforsMetrics):
                                              documentation='Current power of the pump',
                                              unit='watt')
 
-    @handle_exceptions(APIError)
-    def get_active_rotational_speed(self):
-        return self.api.tc400.active_rotational_speed()
-
-    @handle_exceptions(APIError)
-    def get_drive_power(self):
-        return self.api.tc400.drive_power()
+        self._jobs = (
+            (self.active_rotational_speed.set, api.tc400.active_rotational_speed, None),
+            (self.drive_power.set, api.tc400.drive_power, None),
+        )
 
     def update_metrics(self):
-        self.active_rotational_speed.set(self.get_active_rotational_speed())
-        self.drive_power.set(self.get_drive_power())
+        self._update_jobs()
 
 
 class ValveState(IntEnum):
@@ -245,55 +213,42 @@ class SwitchState(IntEnum):
     ON = True
 
 
-def transform_valve_index(valve: str) -> str:
-    match = re.match(r"(v)(\d+)$", valve)
-    if match:
-        prefix, num_str = match.groups()
-        if len(num_str) == 1:
-            num_str = num_str.zfill(2)
-        return f"{prefix}{num_str}"
-    return valve
+# Valve labels are zero-padded (v1 -> v01) so they sort naturally in
+# Prometheus; the mapping is fixed, so build it once at import.
+_VALVE_LABELS = {f'v{i}': f'v{i:02d}' for i in range(1, 21 + 1)}
 
 
 class GasHandlingSystemMetrics(BlueforsMetrics):
-    pressure_sensors = [f'p{i}' for i in range(1, 6 + 1)]
-    valves = [f'v{i}' for i in range(1, 21 + 1)]
-    turbos = ['turbo1']
-    scrolls = [f'scroll{i}' for i in range(1, 2 + 1)]
+    pressure_sensors = tuple(f'p{i}' for i in range(1, 6 + 1))
+    valves = tuple(f'v{i}' for i in range(1, 21 + 1))
+    turbos = ('turbo1',)
+    scrolls = tuple(f'scroll{i}' for i in range(1, 2 + 1))
 
-    @handle_exceptions(APIError)
     def get_pressure(self, sensor: str) -> float:
-        sensor: PressureSensor = getattr(self.api.maxigauge, sensor)
+        sensor: PressureSensor = self._pressure_sensors[sensor]
         if not sensor.enabled():
             return NaN
         pressure: float = sensor.pressure()
         return pressure
 
-    @handle_exceptions(APIError)
     def get_flow(self) -> float:
         flow_mmol_per_s: float = self.api.vc.flow()
         flow_mol_per_s = flow_mmol_per_s / 1000
         return flow_mol_per_s
 
-    @handle_exceptions(APIError)
-    def get_valve_state(self, valve: str) -> ValveState:
-        valve = getattr(self.api.control_unit, valve)
-        valve_state = ValveState(valve())
-        return valve_state
+    def get_valve_state(self, valve: str) -> float:
+        # Gauges take a float anyway; wrapping 21 reads per cycle in
+        # ValveState would allocate an enum instance just to discard it.
+        return float(self._valve_params[valve]())
 
-    @handle_exceptions(APIError)
     def get_turbo_state(self, turbo_index: str) -> bool:
-        turbo = getattr(self.api.control_unit, turbo_index)
-        turbo_state = turbo()
+        turbo_state = self._turbo_params[turbo_index]()
         return turbo_state
 
-    @handle_exceptions(APIError)
     def get_scroll_state(self, scroll_index: str) -> bool:
-        scroll = getattr(self.api.control_unit, scroll_index)
-        scroll_state = scroll()
+        scroll_state = self._scroll_params[scroll_index]()
         return scroll_state
 
-    @handle_exceptions(APIError)
     def get_compressor_state(self) -> bool:
         scroll = self.api.control_unit.compressor
         scroll_state = scroll()
@@ -302,6 +257,17 @@ class GasHandlingSystemMetrics(BlueforsMetrics):
     def __init__(self, api: BlueforsLD400):
         super().__init__(api, subsystem='mixture')
 
+        # Resolve the instrument attribute chains once; every scrape then
+        # does a plain dict lookup instead of walking getattr dispatch.
+        self._pressure_sensors = {sensor: getattr(api.maxigauge, sensor)
+                                  for sensor in self.pressure_sensors}
+        self._valve_params = {valve: getattr(api.control_unit, valve)
+                              for valve in self.valves}
+        self._turbo_params = {turbo: getattr(api.control_unit, turbo)
+                              for turbo in self.turbos}
+        self._scroll_params = {scroll: getattr(api.control_unit, scroll)
+                               for scroll in self.scrolls}
+
         self.pressure = self.create_gauge(name="pressure",
                                           documentation="Gas handling system's pressures",
                                           labelnames=('sensor', ),
@@ -329,31 +295,64 @@ class GasHandlingSystemMetrics(BlueforsMetrics):
         self.compressor = self.create_gauge(name='compressor_state',
                                             documentation="Gas handling system's compressor state")
 
+        # labels() does a dict lookup plus lock acquisition per call, so
+        # resolve the per-label gauge children once up front.
+        self._pressure_children = {sensor: self.pressure.labels(sensor)
+                                   for sensor in self.pressure_sensors}
+        self._valve_children = {valve: self.valve.labels(_VALVE_LABELS[valve])
+                                for valve in self.valves}
+        self._turbo_children = {turbo: self.turbo.labels(turbo)
+                                for turbo in self.turbos}
+        self._scroll_children = {scroll: self.scroll.labels(scroll)
+                                 for scroll in self.scrolls}
 
     def update_metrics(self):
+        # The getters are undecorated on purpose: with ~30 reads per
+        # scrape the wrapper frames of handle_exceptions add up, so the
+        # APIError -> NaN fallback is inlined here instead.
         for sensor in self.pressure_sensors:
-            pressure = self.get_pressure(sensor)
-            self.pressure.labels(sensor).set(pressure)
+            try:
+                pressure = self.get_pressure(sensor)
+            except APIError:
+                pressure = NaN
+            self._pressure_children[sensor].set(pressure)
 
-        self.flow.set(self.get_flow())
+        try:
+            flow = self.get_flow()
+        except APIError:
+            flow = NaN
+        self.flow.set(flow)
 
         for valve in self.valves:
-            valve_state = self.get_valve_state(valve)
-            self.valve.labels(transform_valve_index(valve)).set(valve_state)
+            try:
+                valve_state = self.get_valve_state(valve)
+            except APIError:
+                valve_state = NaN
+            self._valve_children[valve].set(valve_state)
 
         for turbo in self.turbos:
-            turbo_state = self.get_turbo_state(turbo)
-            self.turbo.labels(turbo).set(turbo_state)
+            try:
+                turbo_state = self.get_turbo_state(turbo)
+            except APIError:
+                turbo_state = NaN
+            self._turbo_children[turbo].set(turbo_state)
 
         for scroll in self.scrolls:
-            scroll_state = self.get_scroll_state(scroll)
-            self.scroll.labels(scroll).set(scroll_state)
+            try:
+                scroll_state = self.get_scroll_state(scroll)
+            except APIError:
+                scroll_state = NaN
+            self._scroll_children[scroll].set(scroll_state)
 
-        self.compressor.set(self.get_compressor_state())
+        try:
+            compressor_state = self.get_compressor_state()
+        except APIError:
+            compressor_state = NaN
+        self.compressor.set(compressor_state)
 
 
 class ControlUnitMetrics(BlueforsMetrics):
-    heat_switches = ['hs_still', 'hs_mc']
+    heat_switches = ('hs_still', 'hs_mc')
 
     @handle_exceptions(APIError)
     def get_heat_switch_state(self, heat_switch: str) -> bool:
@@ -376,10 +375,14 @@ class ControlUnitMetrics(BlueforsMetrics):
 
         self.pulse_tube = self.create_gauge(name='pulse_tube_state',
                                             documentation="Pulse tube compressor state")
+
+        self._heat_switch_children = {heat_switch: self.heat_switch.labels(heat_switch)
+                                      for heat_switch in self.heat_switches}
+
     def update_metrics(self):
         for heat_switch in self.heat_switches:
             heat_switch_state = self.get_heat_switch_state(heat_switch)
-            self.heat_switch.labels(heat_switch).set(heat_switch_state)
+            self._heat_switch_children[heat_switch].set(heat_switch_state)
 
         self.pulse_tube.set(self.get_pulse_tube_state())
 
@@ -395,13 +398,17 @@ class TemperatureMetrics(BlueforsMetrics):
                                              labelnames=('flange',),
                                              unit='kelvins')
 
+        self._temperature_children = {flange: self.temperature.labels(flange)
+                                      for flange in self.flanges}
+        self._sensor_temperatures = {flange: getattr(api.lakeshore.sensors, flange).temperature
+                                     for flange in self.flanges}
+
     @handle_exceptions(APIError)
     def get_temperature(self, flange: str) -> float:
         lakeshore = self.api.lakeshore
         if not lakeshore.scanner.autoscan() and flange != lakeshore.scanner.channel():
             return NaN
-        sensor = getattr(self.api.lakeshore.sensors, flange)
-        temperature: float = sensor.temperature()
+        temperature: float = self._sensor_temperatures[flange]()
         if temperature == 0:
             return NaN
         return temperature
@@ -409,14 +416,16 @@ class TemperatureMetrics(BlueforsMetrics):
     def update_metrics(self):
         for flange in self.flanges:
             temperature = self.get_temperature(flange)
-            self.temperature.labels(flange).set(temperature)
+            self._temperature_children[flange].set(temperature)
 
 
 class HeaterMetrics(BlueforsMetrics):
-    heaters = {
+    heaters = (
         'still',
         'sample'
-    }
+    )
+
+    _PID_NAN = (NaN, NaN, NaN, NaN)
 
     def __init__(self, api: BlueforsLD400):
         super().__init__(api, subsystem='heater')
@@ -444,59 +453,54 @@ class HeaterMetrics(BlueforsMetrics):
                                               documentation="Manual heater value",
                                               labelnames=('heater',))
 
-    def _get_heater(self, heater_name):
-        return getattr(self.api.lakeshore.heaters, heater_name)
-
-    @handle_exceptions(APIError)
-    def get_p(self, heater: str) -> float:
-        heater = self._get_heater(heater)
-        return heater.p()
-
-    @handle_exceptions(APIError)
-    def get_i(self, heater: str) -> float:
-        heater = self._get_heater(heater)
-        return heater.i()
-
-    @handle_exceptions(APIError)
-    def get_d(self, heater: str) -> float:
-        heater = self._get_heater(heater)
-        return heater.d()
-
-    @handle_exceptions(APIError)
-    def get_setpoint(self, heater: str) -> float:
-        heater = self._get_heater(heater)
-        return heater.setpoint()
-
-    @handle_exceptions(APIError)
-    def get_manual_value(self, heater: str) -> float:
-        heater = self._get_heater(heater)
-        return heater.manual_value()
+        self._mode_children = {heater: self.mode.labels(heater) for heater in self.heaters}
+        self._range_children = {heater: self.range.labels(heater) for heater in self.heaters}
+        self._p_children = {heater: self.p.labels(heater) for heater in self.heaters}
+        self._i_children = {heater: self.i.labels(heater) for heater in self.heaters}
+        self._d_children = {heater: self.d.labels(heater) for heater in self.heaters}
+        self._setpoint_children = {heater: self.setpoint.labels(heater) for heater in self.heaters}
+        self._manual_value_children = {heater: self.manual_value.labels(heater)
+                                       for heater in self.heaters}
+
+        self._heaters = {heater: getattr(api.lakeshore.heaters, heater)
+                         for heater in self.heaters}
+
+        self._pid_setters = {
+            heater: (self._p_children[heater].set,
+                     self._i_children[heater].set,
+                     self._d_children[heater].set,
+                     self._setpoint_children[heater].set)
+            for heater in self.heaters
+        }
 
     def update_metrics(self):
         for heater_name in self.heaters:
+            heater = self._heaters[heater_name]
             try:
-                heater = self._get_heater(heater_name)
                 heater_mode = heater.mode()
                 heater_range = heater.range()
-                self.mode.labels(heater_name).set(Heater.MODES[heater_mode])
-                self.range.labels(heater_name).set(Heater.RANGES[heater_range])
+                self._mode_children[heater_name].set(Heater.MODES[heater_mode])
+                self._range_children[heater_name].set(Heater.RANGES[heater_range])
             except APIError:
-                self.mode.labels(heater_name).set(NaN)
-                self.range.labels(heater_name).set(NaN)
+                self._mode_children[heater_name].set(NaN)
+                self._range_children[heater_name].set(NaN)
                 heater_mode = 'off'
 
             if heater_mode == 'closed_loop':
-                self.p.labels(heater_name).set(self.get_p(heater_name))
-                self.i.labels(heater_name).set(self.get_i(heater_name))
-                self.d.labels(heater_name).set(self.get_d(heater_name))
-                self.setpoint.labels(heater_name).set(self.get_setpoint(heater_name))
+                try:
+                    pid_values = (heater.p(), heater.i(), heater.d(), heater.setpoint())
+                except APIError:
+                    pid_values = self._PID_NAN
             else:
-                self.p.labels(heater_name).set(NaN)
-                self.i.labels(heater_name).set(NaN)
-                self.d.labels(heater_name).set(NaN)
-                self.setpoint.labels(heater_name).set(NaN)
+                pid_values = self._PID_NAN
+            for setter, value in zip(self._pid_setters[heater_name], pid_values):
+                setter(value)
 
             if heater_mode == 'closed_loop' or heater_mode == 'open_loop':
-                self.manual_value.labels(heater_name).set(self.get_manual_value(heater_name))
+                try:
+                    manual_value = heater.manual_value()
+                except APIError:
+                    manual_value = NaN
             else:
-                self.manual_value.labels(heater_name).set(NaN)
+                manual_value = NaN
+            self._manual_value_children[heater_name].set(manual_value)
@@ -1,7 +1,11 @@
 import os
+import random
+import threading
+import time
+from datetime import timedelta
 
 from dotenv import load_dotenv
-from prometheus_client import make_wsgi_app
+from prometheus_client import Gauge, make_wsgi_app
 from flask import Flask
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from waitress import serve
@@ -16,7 +20,8 @@ bluefors = BlueforsLD400('bluefors',
                          ip=os.getenv("IP"),
                          port=int(os.getenv("PORT")),
                          api_key=os.getenv("API_KEY"),
-                         certificate_path=os.getenv("CERTIFICATE_PATH"))
+                         certificate_path=os.getenv("CERTIFICATE_PATH"),
+                         scheme=os.getenv("SCHEME", "https"))
 
 metrics_list: list[BlueforsMetrics] = [
     PulseTubeCompressorMetrics(bluefors),
@@ -35,20 +40,37 @@ def main():
     return "Prometheus metrics exporter for dilution refrigerator"
 
 
-class MetricsWSGIApp:
-    def __init__(self, wsgi_app):
-        self.wsgi_app = wsgi_app
+# How often the background thread refreshes the gauges. The Bluefors
+# API itself only updates every few seconds, so polling faster than this
+# would just re-read identical data.
+COLLECTION_INTERVAL = timedelta(seconds=5)
+# Random extra delay per cycle so the poll cadence does not phase-lock
+# with the Prometheus scrape interval.
+COLLECTION_JITTER = timedelta(seconds=0.5)
 
-    def __call__(self, environ, start_response):
-        with bluefors.read_session():
-            for metrics in metrics_list:
-                metrics.update_metrics()
-        return self.wsgi_app(environ, start_response)
+last_update_timestamp = Gauge('bluefors_last_update_timestamp_seconds',
+                              'Unix time of the last successful metrics collection')
 
 
+def _collection_loop():
+    while True:
+        try:
+            with bluefors.read_session():
+                for metrics in metrics_list:
+                    metrics.update_metrics()
+            last_update_timestamp.set_to_current_time()
+        except Exception as e:
+            print(f"Collection error: {e}")
+        time.sleep(COLLECTION_INTERVAL.total_seconds()
+                   + random.uniform(0, COLLECTION_JITTER.total_seconds()))
+
+
+collection_thread = threading.Thread(target=_collection_loop, daemon=True)
+collection_thread.start()
+
 app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {
-    '/metrics': MetricsWSGIApp(make_wsgi_app())
+    '/metrics': make_wsgi_app()
 })
 
 if __name__ == '__main__':
-    serve(app, host='0.0.0.0', port=9101)
+    serve(app, host='0.0.0.0', port=9101, threads=4)
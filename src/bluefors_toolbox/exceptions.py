@@ -2,8 +2,7 @@ from datetime import datetime
 
 
 class PIDConfigException(Exception):
-    def __init__(self, msg: str):
-        super().__init__(msg)
+    pass
 
 
 class APIError(Exception):
@@ -14,6 +13,13 @@ class APIError(Exception):
 
 
 class OutdatedError(APIError):
-    def __init__(self, outdated_datetime: datetime):
-        message = f'Outdated since {outdated_datetime}, for {datetime.now() - outdated_datetime}'
-        super().__init__(message, status_code=500)
+    def __init__(self, timestamp_ms: int):
+        # This error fires inside the driver's retry loop and is usually
+        # caught, so message formatting is deferred until something
+        # actually prints it.
+        self.timestamp_ms = timestamp_ms
+        super().__init__(None, status_code=500)
+
+    def __str__(self) -> str:
+        outdated_datetime = datetime.fromtimestamp(self.timestamp_ms / 1_000)
+        return f'Outdated since {outdated_datetime}, for {datetime.now() - outdated_datetime}'
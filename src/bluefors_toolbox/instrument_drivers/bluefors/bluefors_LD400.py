@@ -1,6 +1,6 @@
 import json
+import time
 from contextlib import contextmanager
-from datetime import datetime
 from typing import Any, Optional, Unpack
 
 import requests
@@ -9,6 +9,7 @@ from qcodes.instrument import (
     InstrumentBaseKWArgs,
 )
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from ...exceptions import APIError, OutdatedError
 from .cryomech import CPA
@@ -19,6 +20,17 @@ from .pfeiffer_TC400 import PfeifferTC400
 from .control_unit import ControlUnit
 from .vc import VC
 
+# orjson decodes the multi-hundred-KB /values snapshot several times
+# faster than the stdlib parser; fall back transparently when it is not
+# installed.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 
 def _get_value_from_response(data, target: str) -> Any:
     try:
@@ -28,7 +40,7 @@ def _get_value_from_response(data, target: str) -> Any:
         synchronization_status: str = latest_value["status"]
         if is_outdated:
             timestamp_ms: int = latest_value["date"]
-            raise OutdatedError(datetime.fromtimestamp(timestamp_ms / 1_000))
+            raise OutdatedError(timestamp_ms)
         if synchronization_status != "SYNCHRONIZED":
             raise APIError("Data not synchronized", status_code=500)
         return value
@@ -38,6 +50,8 @@ def _get_value_from_response(data, target: str) -> Any:
 
 class BlueforsLD400(Instrument):
     N_TRY = 5
+    RETRY_BASE_DELAY = 0.05
+    RETRY_DEADLINE = 1.0
 
     def __init__(self,
                  name: str,
@@ -45,13 +59,27 @@ class BlueforsLD400(Instrument):
                  certificate_path: Optional[str] = None,
                  ip: Optional[str] = "localhost",
                  port: Optional[int] = 49098,
+                 scheme: str = 'https',
                  **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(name, **kwargs)
-        self.__url = f'https://{ip}:{port}/values'
-        self.__uri_vars = f'?prettyprint=1&key={api_key}'
+        # Plain http skips the TLS handshake and record encryption; only
+        # use it when the link to the controller is physically trusted.
+        self.__url = f'{scheme}://{ip}:{port}/values'
+        self.__uri_vars = f'?key={api_key}'
+        self.__post_uri = f'{self.__url}/{self.__uri_vars}'
         self._certificate_path = certificate_path or False
 
+        # One keep-alive session for every request: the TLS handshake is
+        # paid once instead of on each of the dozens of reads per scrape.
+        self._session = requests.Session()
+        self._session.mount(f'{scheme}://', HTTPAdapter(pool_connections=2, pool_maxsize=32, max_retries=0))
+        self._session.headers.update({"Content-Type": "application/json"})
+        self._session.verify = self._certificate_path
+
         self.__data: Optional[dict] = None
+        # Targets form a small fixed set, so the formatted request URIs
+        # are built once and reused for every subsequent read.
+        self.__uri_cache: dict[str, str] = {}
 
         self.add_submodule('cpa', CPA(self, 'cpa'))
         self.add_submodule('lakeshore', Lakeshore(self, 'lakeshore'))
@@ -62,19 +90,20 @@ class BlueforsLD400(Instrument):
         self.add_submodule('control_unit', ControlUnit(self, 'control_unit'))
 
     def _get_request_uri(self, target: str) -> str:
-        endpoint = f'{target}'.replace('.', '/')
-        return f"{self.__url}/{endpoint}/{self.__uri_vars}"
+        uri = self.__uri_cache.get(target)
+        if uri is None:
+            endpoint = f'{target}'.replace('.', '/')
+            uri = f"{self.__url}/{endpoint}/{self.__uri_vars}"
+            self.__uri_cache[target] = uri
+        return uri
 
     def _get_value_request(self, target: str) -> Response:
         request_uri = self._get_request_uri(target)
-        response = requests.get(request_uri,
-                                headers={"Content-Type": "application/json"},
-                                verify=self._certificate_path)
+        response = self._session.get(request_uri)
         response.raise_for_status()
         return response
 
     def _post_request(self, target: str, **content) -> Response:
-        request_uri = f'{self.__url}/{self.__uri_vars}'
         body = {
             "data": {
                 f'{target}': {
@@ -83,10 +112,7 @@ class BlueforsLD400(Instrument):
             }
         }
 
-        response = requests.post(request_uri,
-                                 data=json.dumps(body),
-                                 headers={"Content-Type": "application/json"},
-                                 verify=self._certificate_path)
+        response = self._session.post(self.__post_uri, data=_json_dumps(body))
         response.raise_for_status()
         return response
 
@@ -94,14 +120,24 @@ class BlueforsLD400(Instrument):
         self._post_request(target, call=1)
 
     def get_value(self, target: str) -> Any:
-        data = self.__data or self._get_value_request(target)
+        data = self.__data
+        if data is None:
+            data = _json_loads(self._get_value_request(target).content)
         try:
-            return _get_value_from_response(data.json(), target)
+            return _get_value_from_response(data, target)
         except OutdatedError as e:
-            for i in range(self.N_TRY):
+            # Immediate re-reads of a stale target tend to hit the same
+            # snapshot; back off exponentially and give up once the
+            # per-target time budget is spent so one bad sensor cannot
+            # stall a whole collection cycle.
+            deadline = time.monotonic() + self.RETRY_DEADLINE
+            for attempt in range(self.N_TRY):
+                time.sleep(self.RETRY_BASE_DELAY * 2 ** attempt)
+                if time.monotonic() > deadline:
+                    break
                 try:
-                    data = self._get_value_request(target)
-                    return _get_value_from_response(data.json(), target)
+                    data = _json_loads(self._get_value_request(target).content)
+                    return _get_value_from_response(data, target)
                 except OutdatedError:
                     continue
             raise e
@@ -109,10 +145,33 @@ class BlueforsLD400(Instrument):
     def set_value(self, target: str, value: Any) -> None:
         self._post_request(target, value=value)
 
+    def set_values(self, values: dict[str, Any]) -> None:
+        """Set several targets in a single POST request."""
+        body = {
+            "data": {
+                target: {
+                    "content": {"value": value}
+                } for target, value in values.items()
+            }
+        }
+        response = self._session.post(self.__post_uri, data=_json_dumps(body))
+        response.raise_for_status()
+
+    def close(self) -> None:
+        self._session.close()
+        super().close()
+
     @contextmanager
     def read_session(self):
-        self.__data = self._get_value_request('')
+        # Decode the snapshot once on entry; every get_value inside the
+        # block is then a plain dict lookup. Reentrant: a nested session
+        # takes a fresh snapshot and restores the enclosing one on exit,
+        # so helpers like ControlUnit.read_states() can be called from
+        # inside an outer session without degrading its remaining reads
+        # to one request per target.
+        previous = self.__data
+        self.__data = _json_loads(self._get_value_request('').content)
         try:
             yield
         finally:
-            self.__data = None
+            self.__data = previous
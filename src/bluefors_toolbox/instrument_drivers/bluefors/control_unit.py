@@ -39,3 +39,12 @@ class ControlUnit(BlueforsApiModule):
         self.compressor = self.add_parameter('compressor',
                                              ReadonlyParameter,
                                              val_mapping=_bool_mapping)
+
+    def read_states(self) -> dict[str, bool]:
+        """Read every boolean state of the control unit at once.
+
+        All parameters resolve from a single /values snapshot instead of
+        issuing one request each.
+        """
+        with self.parent.read_session():
+            return {name: parameter() for name, parameter in self.parameters.items()}
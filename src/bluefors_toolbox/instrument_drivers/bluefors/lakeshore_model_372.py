@@ -1,5 +1,7 @@
+import sys
 from contextlib import contextmanager
-from typing import Unpack, TYPE_CHECKING, ClassVar
+from types import MappingProxyType
+from typing import Any, Unpack, TYPE_CHECKING, ClassVar
 
 from qcodes.instrument import InstrumentBaseKWArgs
 from qcodes.instrument_drivers.Lakeshore.Lakeshore_model_372 import LakeshoreModel372Output as QCoDeS_LakeshoreOutput
@@ -9,6 +11,13 @@ from .utils import BlueforsApiChannel, ReadonlyParameter, BlueforsApiModule, Par
 if TYPE_CHECKING:
     from .bluefors_LD400 import BlueforsLD400
 
+# Single source of truth for the sensor-name-to-scanner-channel map,
+# frozen so nothing can mutate it behind the scanner's val_mapping.
+SENSOR_CHANNELS = MappingProxyType({'pt1': 1,
+                                    'pt2': 2,
+                                    'still': 5,
+                                    'mxc': 6})
+
 
 class LakeshoreChannel(BlueforsApiChannel):
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
@@ -18,7 +27,9 @@ class LakeshoreChannel(BlueforsApiChannel):
 class Sensor(LakeshoreChannel):
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(parent, name, **kwargs)
-        self.device = f'channel{self._short_name}'
+        # Interned so downstream dict lookups on the device string hash
+        # by pointer.
+        self.device = sys.intern(f'channel{self._short_name}')
 
         self.temperature = self.add_parameter('temperature',
                                               ReadonlyParameter,
@@ -32,7 +43,8 @@ class Heater(LakeshoreChannel):
 
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(parent, name, **kwargs)
-        self.device = self._short_name
+        self.device = sys.intern(self._short_name)
+        self._pending: 'dict[str, Any] | None' = None
 
         self.p = self.add_parameter('p',
                            Parameter,
@@ -71,11 +83,25 @@ class Heater(LakeshoreChannel):
     def accept(self):
         self.call_method('write')
 
+    def _set_resolved_value(self, target: str, value: Any) -> None:
+        if self._pending is not None:
+            self._pending[target] = value
+        else:
+            super()._set_resolved_value(target, value)
+
     @contextmanager
     def write_session(self):
+        # Writes inside the session are buffered and flushed as one
+        # POST before accept(), so a multi-parameter update costs two
+        # round trips instead of one per parameter.
+        self._pending = {}
         try:
             yield
+            pending = self._pending
+            if pending:
+                self.root_instrument.set_values(pending)
         finally:
+            self._pending = None
             self.accept()
 
     def turn_off(self):
@@ -88,10 +114,7 @@ class Heater(LakeshoreChannel):
 class LakeshoreInputs(BlueforsApiModule):
     device = 'status.inputs'
 
-    sensors = {'pt1': 1,
-               'pt2': 2,
-               'still': 5,
-               'mxc': 6}
+    sensors = SENSOR_CHANNELS
 
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(parent, name, **kwargs)
@@ -104,11 +127,11 @@ class LakeshoreInputs(BlueforsApiModule):
 class LakeshoreOutputs(BlueforsApiModule):
     device: str = 'settings.outputs'
 
-    heaters = {
+    heaters: ClassVar[tuple[str, ...]] = (
         'warm_up',
         'still',
         'sample'
-    }
+    )
 
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(parent, name, **kwargs)
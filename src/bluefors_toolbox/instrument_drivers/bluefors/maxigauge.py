@@ -1,3 +1,4 @@
+import sys
 from typing import Unpack
 
 from qcodes.instrument import InstrumentBaseKWArgs
@@ -8,7 +9,7 @@ from .utils import BlueforsApiModule, BlueforsApiChannel, ReadonlyParameter, Par
 class PressureSensor(BlueforsApiChannel):
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(parent, name, **kwargs)
-        self.device = self._short_name
+        self.device = sys.intern(self._short_name)
 
         self.add_parameter('pressure',
                            ReadonlyParameter,
@@ -1,4 +1,4 @@
-from typing import Unpack, Any, TYPE_CHECKING
+from typing import Unpack, Any, ClassVar, NamedTuple, TYPE_CHECKING
 
 import qcodes
 from qcodes import InstrumentChannel
@@ -16,24 +16,55 @@ class ReadonlyParameter(qcodes.parameters.Parameter):
         self.target = name
         if target is not None:
             self.target = target
+        self._resolved_target: 'str | None' = None
+
+    def _resolve_target(self) -> str:
+        """Return the full API target, walking the module chain once.
+
+        Without caching, every read re-prefixes the target with each
+        ancestor module's device string.
+        """
+        target = self._resolved_target
+        if target is None:
+            target = self.target
+            module = self.instrument
+            while isinstance(module, BlueforsApiModule):
+                target = module._get_target(target)
+                module = module.parent
+            self._resolved_target = target
+        return target
 
     def get_raw(self) -> qcodes.parameters.ParamRawDataType:
         """Read the value of the parameter."""
-        return self.instrument.get_value(self.target)
+        return self.instrument.root_instrument.get_value(self._resolve_target())
 
 
 class Parameter(ReadonlyParameter):
     def set_raw(self, value: qcodes.parameters.ParamRawDataType) -> None:
         """Set the value of the parameter."""
-        self.instrument.set_value(self.target, value)
+        self.instrument._set_resolved_value(self._resolve_target(), value)
+
+
+class ParamSpec(NamedTuple):
+    """Declarative spec for a plain float ReadonlyParameter."""
+    name: str
+    unit: str
 
 
 class BlueforsApiModule(InstrumentModule):
     parent: 'BlueforsLD400'
     device: str
+    # Simple read-only float parameters declared once per class instead
+    # of repeated add_parameter calls in every __init__.
+    _PARAM_SPECS: ClassVar[tuple[ParamSpec, ...]] = ()
 
     def __init__(self, parent: 'BlueforsApi | BlueforsApiModule', name: str, **kwargs: Unpack[InstrumentBaseKWArgs]):
         super().__init__(parent, name, **kwargs)
+        for spec in self._PARAM_SPECS:
+            self.add_parameter(spec.name,
+                               ReadonlyParameter,
+                               get_parser=float,
+                               unit=spec.unit)
 
     def _get_target(self, target: str) -> str:
         return f'{self.device}.{target}'.strip('.')
@@ -50,6 +81,10 @@ class BlueforsApiModule(InstrumentModule):
         target = self._get_target(target)
         self.parent.set_value(target, value)
 
+    def _set_resolved_value(self, target: str, value: Any) -> None:
+        """Write a fully-resolved target; modules may buffer writes."""
+        self.root_instrument.set_value(target, value)
+
 
 class BlueforsApiChannel(BlueforsApiModule, InstrumentChannel):
     pass
@@ -0,0 +1,57 @@
+import math
+import time
+import unittest
+from datetime import timedelta
+
+from bluefors_toolbox.temperature_controller import TimedQueue
+
+
+class TestTimedQueue(unittest.TestCase):
+    def make_queue(self, ttl_seconds: float = 60.0) -> TimedQueue:
+        return TimedQueue(timedelta(seconds=ttl_seconds),
+                          timedelta(seconds=0.01))
+
+    def test_span_mean_std(self):
+        queue = self.make_queue()
+        for value in (5.0, 3.0, 4.0):
+            queue.append(value)
+        self.assertEqual(queue.span(), 2.0)
+        self.assertEqual(queue.mean(), 4.0)
+        self.assertAlmostEqual(queue.std(), math.sqrt(2.0 / 3.0))
+
+    def test_empty_stats_are_nan(self):
+        queue = self.make_queue()
+        self.assertTrue(math.isnan(queue.mean()))
+        self.assertTrue(math.isnan(queue.std()))
+        with self.assertRaises(RuntimeError):
+            queue.span()
+
+    def test_duplicate_survives_eviction(self):
+        # Quantized sensors repeat readings exactly; evicting the first
+        # of two equal samples must not drop the survivor from the
+        # min/max tracking.
+        queue = self.make_queue(ttl_seconds=0.4)
+        queue.append(5.0)
+        time.sleep(0.25)
+        queue.append(5.0)
+        queue.append(3.0)
+        time.sleep(0.25)
+        # The first 5.0 has now expired; the second has not. The append
+        # below runs the cleanup and must leave the window [5.0, 3.0, 4.0].
+        queue.append(4.0)
+        self.assertEqual(queue.span(), 2.0)
+        self.assertEqual(queue.mean(), 4.0)
+
+    def test_full_eviction_empties_stats(self):
+        queue = self.make_queue(ttl_seconds=0.05)
+        queue.append(1.0)
+        queue.append(2.0)
+        time.sleep(0.1)
+        queue.append(3.0)
+        self.assertEqual(queue.mean(), 3.0)
+        with self.assertRaises(RuntimeError):
+            queue.span()
+
+
+if __name__ == '__main__':
+    unittest.main()